@@ -1,11 +1,11 @@
 """Test for geospatial embeddings"""
 
 from unittest.mock import patch, Mock
-import redis
 import pytest
 
 from tools.geospatial_embeddings.tool import (
     natural_language_geocode,
+    get_cache_key,
     get_from_cache,
     store_in_cache,
 )
@@ -58,6 +58,14 @@ def mock_geocoder():
 class TestCacheOperations:
     """Test Redis Cache operations."""
 
+    def test_cache_key_is_normalized(self):
+        """Test case and surrounding whitespace do not change the cache key."""
+        key = get_cache_key("San Francisco Bay Area")
+
+        assert key.startswith("geocode:")
+        assert get_cache_key("  san francisco bay area\n") == key
+        assert get_cache_key("Silicon Valley") != key
+
     def test_get_from_cache_hit(self, mock_cache, sample_cache_data):
         """Test successful cache retrieval"""
         mock_cache.get.return_value = sample_cache_data
@@ -76,14 +84,6 @@ class TestCacheOperations:
         assert result is None
         mock_cache.get.assert_called_once()
 
-    def test_get_from_cache_redis_error(self, mock_cache):
-        """Test cache retrieval with Redis error."""
-        mock_cache.get.side_effect = redis.RedisError("Redis connection failed")
-
-        result = get_from_cache("San Francisco Bay Area")
-
-        assert result is None
-
     def test_store_in_cache_success(self, mock_cache):
         """Test successful cache storage with polygon geometry."""
         mock_cache.set.return_value = True
@@ -118,15 +118,6 @@ class TestCacheOperations:
         call_args = mock_cache.set.call_args
         assert call_args[0][2] == 900  # Default TTL
 
-    def test_store_in_cache_redis_error(self, mock_cache):
-        """Test cache storage with Redis error."""
-        mock_cache.set.side_effect = redis.RedisError("Redis connection failed")
-
-        # Should not raise exception, should return None
-        result = store_in_cache("San Francisco Bay Area", {"test": "data"})
-
-        assert result is None
-
 
 class TestNaturalLanguageGeocode:
     """Test the main geocoding function."""
@@ -149,6 +140,7 @@ class TestNaturalLanguageGeocode:
             assert result.from_cache is True
             assert result.success is True
             assert result.geoLocation == "San Francisco Bay Area"
+            assert result.error is None
             mock_get_cache.assert_called_once_with("San Francisco Bay Area")
 
     def test_cache_miss_successful_geocoding(self, sample_geometry):
@@ -177,7 +169,8 @@ class TestNaturalLanguageGeocode:
 
             mock_get_cache.assert_called_once_with("Silicon Valley")
             mock_convert.assert_called_once_with("Silicon Valley")
-            mock_store.assert_called_once()
+            # The validated output is what gets cached
+            mock_store.assert_called_once_with("Silicon Valley", result.model_dump())
 
     def test_cache_miss_failed_geocoding(self):
         """Test cache miss with failed geocoding."""
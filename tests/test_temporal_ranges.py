@@ -4,11 +4,19 @@ import sys
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
 import pytest
-from tools.temporal_ranges.tool import get_temporal_ranges
+from tools.temporal_ranges.tool import get_instructor_client, get_temporal_ranges
 from tools.temporal_ranges.input_model import TemporalRangeInput
 from tools.temporal_ranges.output_model import TemporalRangeOutput
 
 
+@pytest.fixture(autouse=True)
+def reset_instructor_client():
+    """Drop cached instructor clients so each test builds its own."""
+    get_instructor_client.cache_clear()
+    yield
+    get_instructor_client.cache_clear()
+
+
 class TestTemporalRangesMocked:
     """Mocked unit tests for temporal ranges (no LLM dependency)."""
 
@@ -48,6 +56,30 @@ class TestTemporalRangesMocked:
         mock_instructor.assert_called_once_with("bedrock/amazon.nova-pro-v1:0")
         mock_client.create.assert_called_once()
 
+    def test_client_is_reused(self, mock_instructor_client):
+        """Test the instructor client is built once and reused across calls."""
+        mock_instructor, mock_client = mock_instructor_client
+        mock_client.create.return_value = TemporalRangeOutput(reasoning="None")
+
+        get_temporal_ranges(TemporalRangeInput(timerange_string="Show me all data"))
+        get_temporal_ranges(TemporalRangeInput(timerange_string="Show me 2024"))
+
+        mock_instructor.assert_called_once_with("bedrock/amazon.nova-pro-v1:0")
+        assert mock_client.create.call_count == 2
+
+    def test_system_prompt_has_current_date(self, mock_instructor_client):
+        """Test the prompt template is filled in with today's date."""
+        _, mock_client = mock_instructor_client
+        mock_client.create.return_value = TemporalRangeOutput(reasoning="None")
+
+        get_temporal_ranges(TemporalRangeInput(timerange_string="Show me all data"))
+
+        messages = mock_client.create.call_args.kwargs["messages"]
+        system_prompt = messages[0]["content"]
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert f"Current date: {today}" in system_prompt
+        assert "{current_date}" not in system_prompt
+
     def test_date_range_no_dates(self, mock_instructor_client):
         """Test with mocked LLM response returning no dates."""
         _, mock_client = mock_instructor_client
@@ -0,0 +1,62 @@
+"""Tests for logging filter utilities."""
+
+import logging
+from unittest.mock import patch
+
+from util.log_filters import DuplicateMessageFilter
+
+
+def make_record(msg, *args, level=logging.WARNING):
+    """Build a log record for the given message."""
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestDuplicateMessageFilter:
+    """Test the DuplicateMessageFilter."""
+
+    def test_first_message_passes(self):
+        """Test a new message is always logged."""
+        log_filter = DuplicateMessageFilter()
+
+        assert log_filter.filter(make_record("Redis error: %s", "down")) is True
+
+    def test_repeated_message_suppressed_within_window(self):
+        """Test an identical message inside the window is dropped."""
+        log_filter = DuplicateMessageFilter(window=10.0)
+
+        with patch("util.log_filters.time.monotonic", side_effect=[100.0, 105.0]):
+            assert log_filter.filter(make_record("Redis error: %s", "down")) is True
+            assert log_filter.filter(make_record("Redis error: %s", "down")) is False
+
+    def test_repeated_message_passes_after_window(self):
+        """Test an identical message is logged again once the window expires."""
+        log_filter = DuplicateMessageFilter(window=10.0)
+
+        with patch("util.log_filters.time.monotonic", side_effect=[100.0, 111.0]):
+            assert log_filter.filter(make_record("Redis error: %s", "down")) is True
+            assert log_filter.filter(make_record("Redis error: %s", "down")) is True
+
+    def test_distinct_messages_and_levels_pass(self):
+        """Test different messages or levels are not treated as duplicates."""
+        log_filter = DuplicateMessageFilter()
+
+        assert log_filter.filter(make_record("Redis error: %s", "down")) is True
+        assert log_filter.filter(make_record("Redis error: %s", "timeout")) is True
+        assert (
+            log_filter.filter(
+                make_record("Redis error: %s", "down", level=logging.ERROR)
+            )
+            is True
+        )
+
+    def test_tracked_messages_are_bounded(self):
+        """Test the oldest message is evicted once maxsize is reached."""
+        log_filter = DuplicateMessageFilter(maxsize=2)
+
+        log_filter.filter(make_record("first"))
+        log_filter.filter(make_record("second"))
+        log_filter.filter(make_record("third"))
+
+        # "first" was evicted, so it is logged again
+        assert log_filter.filter(make_record("first")) is True
+        assert log_filter.filter(make_record("third")) is False
@@ -1,19 +1,38 @@
 """Tests for Redis client utility."""
 
-import json
 import os
 from unittest.mock import Mock, patch
+import msgpack
+import pytest
 import redis
+import zstandard
 
-from util.redis_client import CacheClient
+from util.log_filters import DuplicateMessageFilter
+from util.redis_client import (
+    CacheClient,
+    get_cache_client,
+    get_connection_pool,
+    logger,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_pool():
+    """Drop the shared pool and client so each test builds its own."""
+    get_connection_pool.cache_clear()
+    get_cache_client.cache_clear()
+    yield
+    get_connection_pool.cache_clear()
+    get_cache_client.cache_clear()
 
 
 class TestCacheClientInitialization:
     """Test CacheClient initialization and connection."""
 
     @patch.dict(os.environ, {"REDIS_HOST": "localhost"}, clear=True)
+    @patch("util.redis_client.redis.BlockingConnectionPool")
     @patch("util.redis_client.redis.Redis")
-    def test_successful_initialization(self, mock_redis_class):
+    def test_successful_initialization(self, mock_redis_class, mock_pool_class):
         """Test successful Redis connection during initialization."""
         mock_client = Mock()
         mock_redis_class.return_value = mock_client
@@ -22,13 +41,22 @@ class TestCacheClientInitialization:
         with patch("util.redis_client.logger") as mock_logger:
             client = CacheClient()
 
-            # Verify Redis client was created with correct parameters
-            mock_redis_class.assert_called_once_with(
+            # Verify the pool was created with correct parameters
+            mock_pool_class.assert_called_once_with(
+                connection_class=redis.SSLConnection,
                 host="localhost",  # Default value
                 port=6379,  # Default value
                 password=None,  # Default value
-                ssl=True,
                 ssl_cert_reqs=None,
+                max_connections=32,  # Default value
+                timeout=1.0,
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
+
+            # Verify Redis client was created on top of the shared pool
+            mock_redis_class.assert_called_once_with(
+                connection_pool=mock_pool_class.return_value
             )
 
             # Verify connection test was performed
@@ -75,6 +103,52 @@ class TestCacheClientInitialization:
             assert client.client is None
 
 
+class TestConnectionPool:
+    """Test the shared connection pool."""
+
+    @patch.dict(os.environ, {"REDIS_POOL_SIZE": "4"}, clear=True)
+    @patch("util.redis_client.redis.BlockingConnectionPool")
+    def test_pool_is_shared(self, mock_pool_class):
+        """Test the pool is built once and honours REDIS_POOL_SIZE."""
+        first = get_connection_pool()
+        second = get_connection_pool()
+
+        assert first is second
+        mock_pool_class.assert_called_once()
+        assert mock_pool_class.call_args.kwargs["max_connections"] == 4
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_clients_share_pool(self, mock_redis_class):
+        """Test every CacheClient is backed by the same pool."""
+        CacheClient()
+        CacheClient()
+
+        pools = [
+            call.kwargs["connection_pool"] for call in mock_redis_class.call_args_list
+        ]
+        assert pools[0] is pools[1]
+
+
+class TestGetCacheClient:
+    """Test the shared cache client."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_client_is_shared(self, mock_redis_class):
+        """Test the client is built and pinged once, then reused."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        first = get_cache_client()
+        second = get_cache_client()
+
+        assert first is second
+        assert isinstance(first, CacheClient)
+        mock_redis_class.assert_called_once()
+        mock_client.ping.assert_called_once()
+
+
 class TestIsAvailable:
     """Test the is_available method."""
 
@@ -99,24 +173,156 @@ class TestIsAvailable:
         # Call is_available (which will call ping again)
         assert client.is_available() is True
 
-        # Verify ping was called at least twice (once in init, once in is_available)
-        assert mock_client.ping.call_count >= 2
+        # Verify ping was called twice (once in init, once in is_available)
+        assert mock_client.ping.call_count == 2
 
     @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.time.monotonic")
     @patch("util.redis_client.redis.Redis")
-    def test_is_available_with_connection_error(self, mock_redis_class):
+    def test_is_available_with_connection_error(self, mock_redis_class, mock_monotonic):
         """Test is_available when ping fails."""
         mock_client = Mock()
         mock_redis_class.return_value = mock_client
+        mock_monotonic.return_value = 100.0
 
         # First ping succeeds (for init), second fails (for is_available)
-        mock_client.ping.side_effect = [True, redis.ConnectionError("Connection lost")]
+        mock_client.ping.side_effect = [
+            True,
+            redis.ConnectionError("Connection lost"),
+            True,
+        ]
 
         client = CacheClient()
 
-        # Now is_available should return False
         assert client.is_available() is False
 
+        # During the backoff window Redis is not pinged again
+        mock_monotonic.return_value = 104.0
+        assert client.is_available() is False
+        assert mock_client.ping.call_count == 2
+
+        # Once it has passed, the next call pings again
+        mock_monotonic.return_value = 106.0
+        assert client.is_available() is True
+        assert mock_client.ping.call_count == 3
+
+
+class TestBackoff:
+    """Test cache operations back off after a Redis error."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.time.monotonic")
+    @patch("util.redis_client.redis.Redis")
+    def test_operations_do_not_ping(self, mock_redis_class, mock_monotonic):
+        """Test cache operations never send a PING of their own."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.return_value = None
+        mock_client.pipeline.return_value.execute.return_value = [None, None]
+        mock_monotonic.return_value = 100.0
+
+        client = CacheClient()
+        client.get("test_key")
+        client.set("test_key", {"key": "value"})
+        client.get_many(["a", "b"])
+        client.set_many({"a": {"key": "a"}})
+
+        mock_client.ping.assert_called_once()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.time.monotonic")
+    @patch("util.redis_client.redis.Redis")
+    def test_one_attempt_per_backoff_window(self, mock_redis_class, mock_monotonic):
+        """Test consecutive failures try Redis and warn once per window."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.side_effect = redis.ConnectionError("Connection lost")
+        mock_client.setex.side_effect = redis.ConnectionError("Connection lost")
+        mock_monotonic.return_value = 100.0
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            # First failure starts the window; later calls skip Redis
+            assert client.get("a") is None
+            assert client.get("b") is None
+            assert client.set("c", {"key": "c"}) is False
+            assert client.get_many(["d", "e"]) == [None, None]
+            assert client.set_many({"f": {"key": "f"}}) is False
+
+            mock_monotonic.return_value = 104.0
+            assert client.get("g") is None
+
+            assert mock_client.get.call_count == 1
+            mock_client.setex.assert_not_called()
+            mock_client.pipeline.assert_not_called()
+            assert mock_logger.warning.call_count == 1
+
+            # After the window one more attempt is made, and fails again
+            mock_monotonic.return_value = 106.0
+            assert client.set("h", {"key": "h"}) is False
+            assert client.get("i") is None
+
+            mock_client.setex.assert_called_once()
+            assert mock_client.get.call_count == 1
+            assert mock_logger.warning.call_count == 2
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.time.monotonic")
+    @patch("util.redis_client.redis.Redis")
+    def test_recovers_after_backoff(self, mock_redis_class, mock_monotonic):
+        """Test operations resume once Redis is back and the window has passed."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.side_effect = [
+            redis.ConnectionError("Connection lost"),
+            b"\x00" + msgpack.packb({"key": "value"}),
+        ]
+        mock_monotonic.return_value = 100.0
+
+        client = CacheClient()
+        assert client.get("test_key") is None
+
+        mock_monotonic.return_value = 106.0
+        assert client.get("test_key") == {"key": "value"}
+        assert client.is_available() is True
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_pool_exhaustion_does_not_back_off(self):
+        """Test waiting too long for a pooled connection is just a miss."""
+        with patch("util.redis_client.redis.Redis"):
+            client = CacheClient()
+
+        # A real pool with every connection checked out
+        pool = redis.BlockingConnectionPool(max_connections=1, timeout=0.01)
+        while not pool.pool.empty():
+            pool.pool.get_nowait()
+        client.client = redis.Redis(connection_pool=pool)
+
+        with patch("util.redis_client.logger") as mock_logger:
+            assert client.get("test_key") is None
+            assert client.set("test_key", {"key": "value"}) is False
+            assert client.get_many(["a", "b"]) == [None, None]
+            assert client.set_many({"a": {"key": "a"}}) is False
+            assert client.is_available() is False
+
+        assert "No connection available" in str(mock_logger.warning.call_args[0][1])
+        assert client._retry_at == 0.0  # pylint: disable=protected-access
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_decode_error_does_not_back_off(self, mock_redis_class):
+        """Test a bad stored value does not stop other reads."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.return_value = b"\x01not zstd"
+
+        client = CacheClient()
+        client.get("a")
+        client.get("b")
+
+        assert mock_client.get.call_count == 2
+
 
 class TestGetMethod:
     """Test the get method."""
@@ -140,13 +346,100 @@ class TestGetMethod:
 
         # Setup test data
         test_data = {"key": "value", "number": 42}
-        mock_client.get.return_value = json.dumps(test_data)
+        mock_client.get.return_value = b"\x00" + msgpack.packb(test_data)
 
         client = CacheClient()
         result = client.get("test_key")
 
         assert result == test_data
-        mock_client.get.assert_called_with("test_key")
+        mock_client.get.assert_called_with("v2:test_key")
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_untagged_value(self, mock_redis_class):
+        """Test a value without a known format tag is treated as a miss."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.return_value = b'{"key": "value"}'
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            assert client.get("test_key") is None
+            assert "Cache read error" in mock_logger.warning.call_args[0][0]
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_corrupt_raw_value(self, mock_redis_class):
+        """Test an undecodable uncompressed value is treated as a miss."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.return_value = b"\x00\xc1"
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            assert client.get("test_key") is None
+            assert "Cache read error" in mock_logger.warning.call_args[0][0]
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_nested_value(self, mock_redis_class):
+        """Test nested structures round-trip through msgpack."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        test_data = {"key": "value", "nested": {"items": [1, 2.5, None, True]}}
+        mock_client.get.return_value = b"\x00" + msgpack.packb(test_data)
+
+        client = CacheClient()
+
+        assert client.get("test_key") == test_data
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_non_str_keys_round_trip(self, mock_redis_class):
+        """Test a value with non-str map keys reads back as it was written."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+        test_data = {1: "a", "nested": {2.5: None, True: [1, 2]}}
+
+        assert client.set("test_key", test_data) is True
+        mock_client.get.return_value = mock_client.setex.call_args[0][2]
+
+        assert client.get("test_key") == test_data
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_compressed_value(self, mock_redis_class):
+        """Test retrieval of a zstd-compressed value."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        test_data = {"geometry": "POLYGON((0 0, 1 0, 1 1, 0 1, 0 0))" * 100}
+        mock_client.get.return_value = b"\x01" + zstandard.compress(
+            msgpack.packb(test_data)
+        )
+
+        client = CacheClient()
+
+        assert client.get("test_key") == test_data
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_corrupt_compressed_value(self, mock_redis_class):
+        """Test a corrupt compressed value is treated as a miss."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.return_value = b"\x01not zstd"
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            assert client.get("test_key") is None
+            assert "Cache read error" in mock_logger.warning.call_args[0][0]
 
     @patch.dict(os.environ, {}, clear=True)
     @patch("util.redis_client.redis.Redis")
@@ -160,7 +453,7 @@ class TestGetMethod:
         result = client.get("nonexistent_key")
 
         assert result is None
-        mock_client.get.assert_called_with("nonexistent_key")
+        mock_client.get.assert_called_with("v2:nonexistent_key")
 
     @patch.dict(os.environ, {}, clear=True)
     @patch("util.redis_client.redis.Redis")
@@ -180,6 +473,38 @@ class TestGetMethod:
             assert "Cache read error" in mock_logger.warning.call_args[0][0]
 
 
+class TestErrorLogging:
+    """Test Redis errors are logged once per outage, not once per key."""
+
+    def test_logger_deduplicates(self):
+        """Test the module logger carries the duplicate-message filter."""
+        assert any(isinstance(f, DuplicateMessageFilter) for f in logger.filters)
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_redis_errors_for_different_keys_log_once(self, mock_redis_class, caplog):
+        """Test failures on different keys share a message and are collapsed."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.get.side_effect = redis.ConnectionError("Dedup test outage")
+
+        # Separate clients back off independently, so both reach Redis
+        first, second = CacheClient(), CacheClient()
+
+        with caplog.at_level("WARNING", logger="util.redis_client"):
+            assert first.get("first_key") is None
+            assert second.get("second_key") is None
+
+        assert mock_client.get.call_count == 2
+
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if "Dedup test outage" in record.getMessage()
+        ]
+        assert messages == ["Cache read error: Dedup test outage"]
+
+
 class TestSetMethod:
     """Test the set method."""
 
@@ -207,7 +532,7 @@ class TestSetMethod:
 
         assert result is True
         mock_client.setex.assert_called_once_with(
-            "test_key", 600, json.dumps(test_data)
+            "v2:test_key", 600, b"\x00" + msgpack.packb(test_data)
         )
 
     @patch.dict(os.environ, {}, clear=True)
@@ -224,9 +549,26 @@ class TestSetMethod:
 
         assert result is True
         mock_client.setex.assert_called_once_with(
-            "test_key", 900, json.dumps(test_data)
+            "v2:test_key", 900, b"\x00" + msgpack.packb(test_data)
         )
 
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_compresses_large_values(self, mock_redis_class):
+        """Test values above the threshold are stored zstd-compressed."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+        test_data = {"geometry": "POLYGON((0 0, 1 0, 1 1, 0 1, 0 0))" * 100}
+
+        assert client.set("test_key", test_data) is True
+
+        stored = mock_client.setex.call_args[0][2]
+        assert stored[:1] == b"\x01"
+        assert len(stored) < len(msgpack.packb(test_data))
+        assert msgpack.unpackb(zstandard.decompress(stored[1:])) == test_data
+
     @patch.dict(os.environ, {}, clear=True)
     @patch("util.redis_client.redis.Redis")
     def test_set_with_redis_error(self, mock_redis_class):
@@ -243,3 +585,186 @@ class TestSetMethod:
             assert result is False
             mock_logger.warning.assert_called_once()
             assert "Cache write error" in mock_logger.warning.call_args[0][0]
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_unserializable_value(self, mock_redis_class):
+        """Test set with a value that cannot be serialized."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            assert client.set("test_key", {"data": object()}) is False
+            assert "Cache write error" in mock_logger.warning.call_args[0][0]
+
+        mock_client.setex.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_after_unserializable_value(self, mock_redis_class):
+        """Test a failed write leaves nothing behind in the reused encoder."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+        test_data = {"key": "value"}
+
+        assert client.set("bad_key", {"data": object()}) is False
+        assert client.set("test_key", test_data) is True
+        assert client.set("test_key", test_data) is True
+
+        assert [call.args for call in mock_client.setex.call_args_list] == [
+            ("v2:test_key", 900, b"\x00" + msgpack.packb(test_data)),
+            ("v2:test_key", 900, b"\x00" + msgpack.packb(test_data)),
+        ]
+
+
+class TestGetManyMethod:
+    """Test the get_many method."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_get_many_with_unavailable_client(self):
+        """Test get_many when client is unavailable."""
+        client = CacheClient()
+        client.client = None
+
+        assert client.get_many(["a", "b"]) == [None, None]
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_many_empty_keys(self, mock_redis_class):
+        """Test get_many with no keys skips Redis entirely."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+
+        assert client.get_many([]) == []
+        mock_client.pipeline.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_many_uses_single_pipeline(self, mock_redis_class):
+        """Test get_many queues every GET on one non-transactional pipeline."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_pipe = mock_client.pipeline.return_value
+        mock_pipe.execute.return_value = [
+            b"\x00" + msgpack.packb({"key": "a"}),
+            None,
+            b"\x01not zstd",
+        ]
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            result = client.get_many(["a", "b", "c"])
+
+        assert result == [{"key": "a"}, None, None]
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert [call.args for call in mock_pipe.get.call_args_list] == [
+            ("v2:a",),
+            ("v2:b",),
+            ("v2:c",),
+        ]
+        mock_pipe.execute.assert_called_once()
+        # Only the undecodable entry is reported
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args[0][1] == "c"
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_get_many_with_redis_error(self, mock_redis_class):
+        """Test get_many with Redis error."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.pipeline.return_value.execute.side_effect = redis.RedisError(
+            "Server error"
+        )
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            result = client.get_many(["a", "b"])
+
+            assert result == [None, None]
+            assert "Cache read error" in mock_logger.warning.call_args[0][0]
+
+
+class TestSetManyMethod:
+    """Test the set_many method."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_set_many_with_unavailable_client(self):
+        """Test set_many when client is unavailable."""
+        client = CacheClient()
+        client.client = None
+
+        assert client.set_many({"a": {"data": "value"}}) is False
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_many_empty_items(self, mock_redis_class):
+        """Test set_many with nothing to write skips Redis entirely."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+
+        assert client.set_many({}) is True
+        mock_client.pipeline.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_many_uses_single_pipeline(self, mock_redis_class):
+        """Test set_many queues every SETEX on one non-transactional pipeline."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_pipe = mock_client.pipeline.return_value
+
+        client = CacheClient()
+        result = client.set_many({"a": {"key": "a"}, "b": {"key": "b"}}, 600)
+
+        assert result is True
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert [call.args for call in mock_pipe.setex.call_args_list] == [
+            ("v2:a", 600, b"\x00" + msgpack.packb({"key": "a"})),
+            ("v2:b", 600, b"\x00" + msgpack.packb({"key": "b"})),
+        ]
+        mock_pipe.execute.assert_called_once()
+        mock_client.setex.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_many_with_redis_error(self, mock_redis_class):
+        """Test set_many with Redis error."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+        mock_client.pipeline.return_value.execute.side_effect = redis.RedisError(
+            "Server error"
+        )
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            result = client.set_many({"a": {"data": "value"}})
+
+            assert result is False
+            assert "Cache write error" in mock_logger.warning.call_args[0][0]
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("util.redis_client.redis.Redis")
+    def test_set_many_unserializable_value(self, mock_redis_class):
+        """Test set_many with a value that cannot be serialized."""
+        mock_client = Mock()
+        mock_redis_class.return_value = mock_client
+
+        client = CacheClient()
+
+        with patch("util.redis_client.logger") as mock_logger:
+            assert client.set_many({"a": {"data": object()}}) is False
+            assert "Cache write error" in mock_logger.warning.call_args[0][0]
+
+        mock_client.pipeline.return_value.execute.assert_not_called()
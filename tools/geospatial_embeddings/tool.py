@@ -9,46 +9,44 @@ Langfuse integration for observability.
 
 import hashlib
 
+from functools import lru_cache
 from typing import Any, Dict
-import redis
 from langfuse import observe, get_client
 
 from util.natural_language_geocoder import convert_text_to_geom
-from util.redis_client import CacheClient
+from util.redis_client import get_cache_client
 from .output_model import GeospatialOutput
 
 # Initialize clients
 langfuse = get_client()
-cache = CacheClient()
+cache = get_cache_client()
 
 
+@lru_cache(maxsize=1024)
 def get_cache_key(location: str) -> str:
     """Generate a consistent cache key for the location."""
-    normalized = location.lower().strip()
+    # Strip first so lower() only runs over the meaningful characters
+    normalized = location.strip().lower()
     return f"geocode:{hashlib.md5(normalized.encode()).hexdigest()}"
 
 
 @observe(name="cache_lookup")
 def get_from_cache(location: str) -> Dict[str, Any]:
-    """Get geocoded result from Redis cache."""
-    try:
-        cache_key = get_cache_key(location)
+    """Get geocoded result from Redis cache.
 
-        return cache.get(cache_key)
+    Redis errors are handled and logged by the cache client, which returns
+    None for them like any other miss.
+    """
+    cache_key = get_cache_key(location)
 
-    except redis.RedisError as e:
-        print(f"Redis error when reading from cache: {e}")
-        return None
+    return cache.get(cache_key)
 
 
 @observe(name="cache_store")
 def store_in_cache(location: str, result: Dict[str, Any], ttl: int = 900) -> None:
     """Store geocoded result in Redis cache."""
-    try:
-        cache_key = get_cache_key(location)
-        return cache.set(cache_key, result, ttl)
-    except redis.RedisError as e:
-        print(f"Redis error when storing to cache: {e}")
+    cache_key = get_cache_key(location)
+    return cache.set(cache_key, result, ttl)
 
 
 @observe(name="natural_language_geocode")
@@ -105,7 +103,9 @@ def natural_language_geocode(location: str) -> GeospatialOutput:
                 "location_length": len(location),
             },
         )
-        return GeospatialOutput(**cached_result)
+        # Cached entries were validated before they were stored, so skip
+        # re-validation; model_construct still fills in missing defaults.
+        return GeospatialOutput.model_construct(**cached_result)
 
     # Cache miss - geocode the location
     try:
@@ -119,8 +119,9 @@ def natural_language_geocode(location: str) -> GeospatialOutput:
                 "from_cache": False,
             }
 
-            # Store in cache
-            store_in_cache(location, result)
+            # Validate before storing, so cache hits can skip re-validation
+            output = GeospatialOutput(**result)
+            store_in_cache(location, output.model_dump())
 
             langfuse.update_current_trace(
                 tags=["cache_miss", "success", "geocoded"],
@@ -132,7 +133,7 @@ def natural_language_geocode(location: str) -> GeospatialOutput:
                 },
             )
 
-            return GeospatialOutput(**result)
+            return output
         else:
             langfuse.update_current_trace(
                 tags=["cache_miss", "error", "geocoding_failed"],
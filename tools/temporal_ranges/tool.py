@@ -5,7 +5,8 @@ natural language queries using LLM-based parsing.
 """
 
 from datetime import datetime, timezone
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 from pathlib import Path
 import logging
 import instructor
@@ -23,6 +24,29 @@ except Exception as e:
     LANGFUSE = None
 
 
+@lru_cache(maxsize=None)
+def load_prompt_parts(prompt_path: Path) -> Tuple[str, ...]:
+    """Read a prompt template once and split it around {current_date}.
+
+    Joining the parts with today's date rebuilds the prompt in a single pass.
+    """
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Required prompt file not found: {prompt_path}")
+
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return tuple(f.read().split("{current_date}"))
+
+
+@lru_cache(maxsize=16)
+def get_instructor_client(provider: str, model_id: str):
+    """Return the instructor client for a provider and model, built once.
+
+    Building the client creates the underlying provider SDK client, so it is
+    reused across calls instead of being rebuilt for every query.
+    """
+    return instructor.from_provider(f"{provider}/{model_id}")
+
+
 @observe(name="get_temporal_ranges")
 def get_temporal_ranges(
     query: TemporalRangeInput,
@@ -39,7 +63,7 @@ def get_temporal_ranges(
         (dictionary representation of TemporalRangeOutput).
     """
     try:
-        client = instructor.from_provider(f"{provider}/{model_id}")
+        client = get_instructor_client(provider, model_id)
     except Exception as e:
         if LANGFUSE:
             LANGFUSE.update_current_trace(
@@ -58,12 +82,7 @@ def get_temporal_ranges(
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     # Load prompt from prompt.md file
     prompt_path = Path(__file__).parent / "prompt.md"
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Required prompt file not found: {prompt_path}")
-
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        system_prompt = f.read().replace("{current_date}", today)
+    system_prompt = today.join(load_prompt_parts(prompt_path))
 
     try:
         output = client.create(
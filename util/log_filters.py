@@ -0,0 +1,45 @@
+"""Logging filters shared across modules."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+
+class DuplicateMessageFilter(logging.Filter):
+    """
+    Drop repeated log records within a time window.
+
+    Records are identified by level and formatted message, so a burst of
+    identical errors (e.g. every cache call failing while Redis is down) is
+    written once per window instead of once per request.
+    """
+
+    def __init__(self, window: float = 10.0, maxsize: int = 128):
+        """
+        Args:
+            window: Seconds during which a repeated message is suppressed
+            maxsize: Maximum number of distinct messages tracked at once
+        """
+        super().__init__()
+        self.window = window
+        self.maxsize = maxsize
+        self._last_seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False if the same message was already logged in the window."""
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+
+        with self._lock:
+            last_seen = self._last_seen.get(key)
+            if last_seen is not None and now - last_seen < self.window:
+                return False
+
+            self._last_seen[key] = now
+            self._last_seen.move_to_end(key)
+            while len(self._last_seen) > self.maxsize:
+                self._last_seen.popitem(last=False)
+
+        return True
@@ -1,13 +1,130 @@
 """Redis client for caching operation"""
 
 import os
-import json
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from functools import lru_cache
+from queue import Empty
+from typing import Any, Dict, List, Optional
+import msgpack
 import redis
+import zstandard
 from redis.exceptions import RedisError
 
+from util.log_filters import DuplicateMessageFilter
+
 logger = logging.getLogger(__name__)
+# Redis errors are logged without the key, so while Redis is down every
+# failing call produces the same message and the filter collapses them
+logger.addFilter(DuplicateMessageFilter())
+
+# Every key is namespaced with the value format version, so entries written
+# in an older format are never read back as the current one.
+KEY_PREFIX = "v2:"
+
+# Payloads larger than this many bytes are zstd-compressed before they are
+# written. Every stored value is prefixed with a one-byte tag saying which.
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 3
+_RAW_TAG = b"\x00"
+_ZSTD_TAG = b"\x01"
+
+# After a Redis error, cache operations are skipped for this many seconds
+# before Redis is tried again, so an outage costs one failed attempt (and one
+# log line) per window instead of one per call
+RETRY_BACKOFF = 5.0
+
+# Errors raised while decoding a stored value
+_DECODE_ERRORS = (
+    msgpack.UnpackException,
+    ValueError,
+    zstandard.ZstdError,
+    TypeError,
+)
+
+
+# Per-thread encoders, reused across writes so their internal buffers are
+# not reallocated for every value. Neither is safe to share between threads.
+_encoders = threading.local()
+
+
+def _packer() -> msgpack.Packer:
+    """Return this thread's msgpack Packer."""
+    packer = getattr(_encoders, "packer", None)
+    if packer is None:
+        packer = _encoders.packer = msgpack.Packer(use_bin_type=True)
+    return packer
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    """Return this thread's zstd compressor."""
+    compressor = getattr(_encoders, "compressor", None)
+    if compressor is None:
+        compressor = _encoders.compressor = zstandard.ZstdCompressor(
+            level=COMPRESSION_LEVEL
+        )
+    return compressor
+
+
+def _serialize(value: Dict[str, Any]) -> bytes:
+    """Serialize a value to msgpack bytes, compressing it if it is large."""
+    payload = _packer().pack(value)
+    if len(payload) > COMPRESSION_THRESHOLD:
+        return _ZSTD_TAG + _compressor().compress(payload)
+    return _RAW_TAG + payload
+
+
+def _deserialize(data: bytes) -> Dict[str, Any]:
+    """Decode a value written by _serialize."""
+    tag, payload = data[:1], data[1:]
+    if tag == _ZSTD_TAG:
+        payload = zstandard.decompress(payload)
+    elif tag != _RAW_TAG:
+        raise ValueError(f"Unknown cache value tag: {tag!r}")
+    # Values come only from _serialize, which accepts any map key msgpack can
+    # pack, so non-str keys must be readable too
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+def _is_pool_exhausted(error: RedisError) -> bool:
+    """Return True if error is the pool timing out on connection checkout.
+
+    BlockingConnectionPool raises a plain ConnectionError for this while
+    handling the queue.Empty from its connection queue.
+    """
+    return isinstance(error, redis.ConnectionError) and isinstance(
+        error.__context__, Empty
+    )
+
+
+def _namespaced(key: str) -> str:
+    """Return the Redis key a cache key is stored under."""
+    return KEY_PREFIX + key
+
+
+@lru_cache(maxsize=None)
+def get_connection_pool() -> redis.BlockingConnectionPool:
+    """
+    Return the process-wide Redis connection pool.
+
+    The pool is created on first use and shared by every CacheClient, so the
+    number of open connections stays bounded under concurrent tool calls.
+    Responses are parsed by hiredis when it is installed.
+    """
+    return redis.BlockingConnectionPool(
+        connection_class=redis.SSLConnection,
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=6379,
+        password=os.getenv("REDIS_PASSWORD"),
+        ssl_cert_reqs=None,
+        max_connections=int(os.getenv("REDIS_POOL_SIZE", "32")),
+        timeout=1.0,
+        # Keep idle connections alive, and check one with a PING only when it
+        # has sat unused long enough that the server may have dropped it
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
 
 
 class CacheClient:
@@ -20,18 +137,13 @@ class CacheClient:
     def __init__(self):
         """Initialize Redis client with environment-based configuration."""
         self.client = None
+        self._retry_at = 0.0
         self._connect()
 
     def _connect(self):
         """Establish Redis connection with proper error handling."""
         try:
-            self.client = redis.Redis(
-                host=os.getenv("REDIS_HOST", "localhost"),
-                port=6379,
-                password=os.getenv("REDIS_PASSWORD"),
-                ssl=True,
-                ssl_cert_reqs=None,
-            )
+            self.client = redis.Redis(connection_pool=get_connection_pool())
 
             # Test connection
             self.client.ping()
@@ -43,15 +155,36 @@ class CacheClient:
             )
             self.client = None
 
+    def _usable(self) -> bool:
+        """Return True if there is a client and it is not backing off."""
+        return self.client is not None and time.monotonic() >= self._retry_at
+
+    def _back_off(self, error: RedisError):
+        """Skip Redis for RETRY_BACKOFF seconds after an error from Redis.
+
+        Timing out while waiting for a free pooled connection is not a Redis
+        failure, just a busy process, so it only costs that one call a miss.
+        """
+        if _is_pool_exhausted(error):
+            return
+        self._retry_at = time.monotonic() + RETRY_BACKOFF
+
     def is_available(self) -> bool:
-        """Check if Redis client is available and connected."""
-        if self.client is None:
+        """
+        Check if Redis client is available and connected.
+
+        Cache operations do not call this; they go straight to Redis. Any
+        error from Redis, here or in an operation, makes the client report
+        itself unavailable for RETRY_BACKOFF seconds without contacting Redis.
+        """
+        if not self._usable():
             return False
 
         try:
             self.client.ping()
             return True
-        except RedisError:
+        except RedisError as e:
+            self._back_off(e)
             return False
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
@@ -62,41 +195,129 @@ class CacheClient:
             key: Cache key to retrieve
 
         Returns:
-            Parsed JSON data if found, None if not found or on error
+            Decoded data if found, None if not found or on error
         """
-        if not self.is_available():
+        if not self._usable():
             return None
 
         try:
-            cached_data = self.client.get(key)
+            cached_data = self.client.get(_namespaced(key))
             if cached_data:
-                return json.loads(cached_data)
+                return _deserialize(cached_data)
+            return None
+
+        except RedisError as e:
+            self._back_off(e)
+            logger.warning("Cache read error: %s", e)
             return None
 
-        except (RedisError, json.JSONDecodeError, TypeError) as e:
+        except _DECODE_ERRORS as e:
             logger.warning("Cache read error for key '%s': %s", key, e)
             return None
 
+    def get_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several values from Redis cache in a single round trip.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Parsed data for each key in the same order, with None for keys
+            that were not found or could not be read
+        """
+        if not keys or not self._usable():
+            return [None] * len(keys)
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.get(_namespaced(key))
+            cached_values = pipe.execute()
+
+        except RedisError as e:
+            self._back_off(e)
+            logger.warning("Cache read error: %s", e)
+            return [None] * len(keys)
+
+        results = []
+        for key, cached_data in zip(keys, cached_values):
+            try:
+                results.append(_deserialize(cached_data) if cached_data else None)
+            except _DECODE_ERRORS as e:
+                logger.warning("Cache read error for key '%s': %s", key, e)
+                results.append(None)
+        return results
+
     def set(self, key: str, value: Dict[str, Any], ttl: int = 900) -> bool:
         """
         Set a value in Redis cache.
 
         Args:
             key: Cache key
-            value: Data to cache (will be JSON serialized)
+            value: Data to cache (msgpack serialized, zstd-compressed if large)
             ttl: Time to live in seconds (default: 15 minutes)
 
         Returns:
             True if successful, False otherwise
         """
-        if not self.is_available():
+        if not self._usable():
             return False
 
         try:
-            serialized_data = json.dumps(value)
-            self.client.setex(key, ttl, serialized_data)
+            serialized_data = _serialize(value)
+            self.client.setex(_namespaced(key), ttl, serialized_data)
             return True
 
-        except (RedisError, TypeError, ValueError) as e:
+        except RedisError as e:
+            self._back_off(e)
+            logger.warning("Cache write error: %s", e)
+            return False
+
+        except (TypeError, ValueError) as e:
             logger.warning("Cache write error for key '%s': %s", key, e)
             return False
+
+    def set_many(self, items: Dict[str, Dict[str, Any]], ttl: int = 900) -> bool:
+        """
+        Set several values in Redis cache in a single round trip.
+
+        Args:
+            items: Mapping of cache key to data to cache
+            ttl: Time to live in seconds (default: 15 minutes)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not items:
+            return True
+
+        if not self._usable():
+            return False
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(_namespaced(key), ttl, _serialize(value))
+            pipe.execute()
+            return True
+
+        except RedisError as e:
+            self._back_off(e)
+            logger.warning("Cache write error: %s", e)
+            return False
+
+        except (TypeError, ValueError) as e:
+            logger.warning("Cache write error for %d keys: %s", len(items), e)
+            return False
+
+
+@lru_cache(maxsize=None)
+def get_cache_client() -> CacheClient:
+    """
+    Return the process-wide CacheClient.
+
+    The client is created, and its connection checked, on first use only;
+    later callers reuse it instead of paying for another handshake.
+    """
+    return CacheClient()